@@ -11,26 +11,14 @@ def analyze(machine_code, path_save_results='ethertracer_analyze.txt'):
     :return: A list of booleans. True for code, False for data
     """
 
-    push_data_mask = tagger.tag_push_data(machine_code)
-    invalid_mnemonic_mask = tagger.tag_invalid_mnemonics(machine_code)
-    jumpdest_mask = tagger.tag_mnemonic(machine_code, "JUMPDEST")
-    jump_mask = tagger.tag_mnemonic(machine_code, "JUMP")
-    stop_mask = tagger.tag_mnemonic(machine_code, "STOP")
-    return_mask = tagger.tag_mnemonic(machine_code, "RETURN")
-    selfdestruct_mask = tagger.tag_mnemonic(machine_code, "SELFDESTRUCT")
-
-    # Ignore findings within push-data
-    invalid_mnemonic_mask = np.logical_and(invalid_mnemonic_mask, np.invert(push_data_mask))
-    jumpdest_mask = np.logical_and(jumpdest_mask, np.invert(push_data_mask))
-    jump_mask = np.logical_and(jump_mask, np.invert(push_data_mask))
-    stop_mask = np.logical_and(stop_mask, np.invert(push_data_mask))
-    return_mask = np.logical_and(return_mask, np.invert(push_data_mask))
-    selfdestruct_mask = np.logical_and(selfdestruct_mask, np.invert(push_data_mask))
+    machine_code = helpers.bytes_to_array(machine_code)
 
+    # tag the machine-code, ignoring findings within push-data
+    (push_data_mask, invalid_mnemonic_mask, jumpdest_mask, jump_mask, stop_mask, return_mask, selfdestruct_mask) = tagger.tag_all(machine_code)
 
     # segment the machine-code
     start_flag_mask = jumpdest_mask # Marks the beginning of a segment
-    end_flag_mask = np.logical_and(jump_mask, np.logical_and(stop_mask, np.logical_and(return_mask, selfdestruct_mask))) # Marks the end of a segment
+    end_flag_mask = np.logical_or(jump_mask, np.logical_or(stop_mask, np.logical_or(return_mask, selfdestruct_mask))) # Marks the end of a segment
     segments = analyzer.segment_code(machine_code, start_flag_mask, end_flag_mask)   # During segmentation, ignore mnemonics within push-data
 
     # check the segments
@@ -50,61 +38,31 @@ def analyze(machine_code, path_save_results='ethertracer_analyze.txt'):
 
 def _print_results_to_txt(machine_code, push_data_mask, valid_segments_mask, contract_starts_mask, segments, mnemonic_segment_check_mask, pushjump_segment_check_mask, jumpdest_segment_check_mask, path):
 
-    conclusion = []
-    for row in range(len(machine_code)):
-        conclusion.append([None, None, None, None, None, None])
-
-    column = 0
-    for row in range(len(machine_code)):
-        conclusion[row][column] = row
-
-    column = 1
-    contract = False
-    for row in range(len(machine_code)):
-        if(contract_starts_mask[row]):
-            contract = True
-            i=0
-            conclusion[row][column] = i
-            i = i + 1
-        elif(contract):
-            conclusion[row][column] = i
-            i = i+1
-        else:
-            conclusion[row][column] = "x"
-
-    column = 2
-    for row in range(len(machine_code)):
-        if(valid_segments_mask[row] and not push_data_mask[row]):
-            conclusion[row][column] = opcodes.BYTECODES[machine_code[row]].name
-        else:
-            conclusion[row][column] = hex(machine_code[row])
-
-    column = 3
-    for row in range(len(machine_code)):
-        if(valid_segments_mask[row]):
-            conclusion[row][column] = "CODE"
-        else:
-            conclusion[row][column] = "DATA"
-
-    column = 4
-    for row in range(len(machine_code)):
-        conclusion[row][column] = "segment " + str(segments[row])
-
-    column = 5
-    for row in range(len(machine_code)):
-        if (not jumpdest_segment_check_mask[row]):
-            conclusion[row][column] = "JUMPDEST NEVER REACHED"
-        elif (not mnemonic_segment_check_mask[row]):
-            conclusion[row][column] = "INVALID MNEMONIC OCCURS"
-        elif(not pushjump_segment_check_mask[row]):
-            conclusion[row][column] = "JUMP OUT OF RANGE"
-        else:
-            conclusion[row][column] = ' '
-
-
-    conclusion.insert(0, ["Address:", "Contract Address:", "Instruction:", "Code / Data:", "Segment:", "Finding:"])
-    print_conclusion = np.array(conclusion)
-    np.savetxt(path, print_conclusion, fmt='%30s', delimiter=' ')
+    addresses = np.arange(len(machine_code))
+
+    conclusion = [None, None, None, None, None, None]
+
+    conclusion[0] = addresses
+
+    last_contract_start = np.maximum.accumulate(np.where(contract_starts_mask, addresses, -1))  # most recent contract entrance point
+    conclusion[1] = np.where(last_contract_start >= 0, (addresses - last_contract_start).astype(str), "x")
+
+    conclusion[2] = np.where(np.logical_and(valid_segments_mask, np.invert(push_data_mask)), tagger.NAME_LUT[machine_code], tagger.HEX_LUT[machine_code])
+
+    conclusion[3] = np.where(valid_segments_mask, "CODE", "DATA")
+
+    conclusion[4] = np.char.add("segment ", np.asarray(segments).astype(str))
+
+    conclusion[5] = np.select([np.invert(jumpdest_segment_check_mask), np.invert(mnemonic_segment_check_mask), np.invert(pushjump_segment_check_mask)],
+                              ["JUMPDEST NEVER REACHED", "INVALID MNEMONIC OCCURS", "JUMP OUT OF RANGE"], ' ')
+
+    header = ["Address:", "Contract Address:", "Instruction:", "Code / Data:", "Segment:", "Finding:"]
+    row_format = ' '.join(['%30s'] * len(header)) + '\n'
+
+    # write row by row instead of building one table of strings
+    with open(path, 'w') as file:
+        file.write(row_format % tuple(header))
+        file.writelines(row_format % row for row in zip(*(column.tolist() for column in conclusion)))
 
 
     None
@@ -58,12 +58,10 @@ def validate_segment_jumps(machine_code, segments, push_data_mask, jumps_mask, m
         jumps_mask = np.logical_and(jumps_mask, masking)
 
     pushjumps = _get_pushjump_data(machine_code, push_data_mask, jumps_mask)    # all addresses where a push-command is followed by a jump
-    invalid_jump_addresses = pushjumps[np.argwhere(pushjumps[:, 1] > len(machine_code)), 0].flatten()   # get every jump address that jumps out of scope
+    invalid_jump_addresses = pushjumps[pushjumps[:, 1] > len(machine_code), 0].astype(np.int64)   # get every jump address that jumps out of scope
 
-    invalid_jumps_mask = [False] * len(machine_code)
-
-    for i in invalid_jump_addresses:
-        invalid_jumps_mask[i] = True
+    invalid_jumps_mask = np.zeros(len(machine_code), dtype=bool)
+    invalid_jumps_mask[invalid_jump_addresses] = True
 
     return _tag_valid_segments(segments, invalid_jumps_mask, invalid_indicator=True)
 
@@ -119,25 +117,77 @@ def search_contract_starts(machine_code, push_data_mask, jumpdests_mask, masking
     total_hits = 0
     hit_ratio = 0  # ratio of jumpdests that are reachable
 
-    while (hit_ratio < stop_threshold and len(jumpdest_indices) >= 0): # loop until a specific amount of jumpdests become valid
+    push_data = _get_push_data_indicator(push_data, len(machine_code)).nonzero()[0]
+
+    # common case: a single contract that starts at address 0 and reaches every jumpdest, so bias 0 is the best bias.
+    # Without any jumpdest the contract is assumed to start at address 0 as well
+    hits_at_zero = np.count_nonzero(np.isin(jumpdest_indices, push_data, assume_unique=True))
+    if (hits_at_zero == total_jumpdest_number and len(machine_code) > 0):
+        starting_points_mask[0] = True
+        return starting_points_mask
 
-        bias_hits = np.zeros(len(machine_code))
+    bias_hits = _count_bias_hits(push_data, jumpdest_indices, len(machine_code))    # count the jumpdest that are valid for every bias
 
-        for bias in range(len(machine_code)):
-            bias_hits[bias] = len(set(push_data).intersection(set(jumpdest_indices - bias)))    # count the jumpdest that are valid for a specific bias
+    while (hit_ratio < stop_threshold and len(jumpdest_indices) > 0): # loop until a specific amount of jumpdests become valid
 
         best_bias = bias_hits.argmax()  # find the best bias. The bias will supposed to be a contract entrance point
         hits_best_bias = bias_hits.max()
 
+        if (hits_best_bias == 0):   # no further jumpdest can be reached
+            break
+
         starting_points_mask[best_bias] = True
         total_hits = total_hits + hits_best_bias
         hit_ratio = total_hits / total_jumpdest_number
 
-        jumpdest_indices = np.array(list(set(jumpdest_indices).difference(np.array(list(set(push_data).intersection(jumpdest_indices - best_bias))) + best_bias)))  # remove findings
+        found_jumpdests = np.isin(jumpdest_indices - best_bias, push_data, assume_unique=True)
+        removed_jumpdests = jumpdest_indices[found_jumpdests]
+        jumpdest_indices = jumpdest_indices[np.invert(found_jumpdests)]  # remove findings
+
+        # withdraw the hits of the removed jumpdests from every bias instead of counting all biases again
+        removed_biases = (removed_jumpdests[:, None] - push_data[None, :]).ravel()
+        np.subtract.at(bias_hits, removed_biases[removed_biases >= 0], 1)
 
     return starting_points_mask
 
 
+def _count_bias_hits(push_data, jumpdest_indices, length):
+    """
+    Counts for every possible bias how many jumpdests are reached by the pushed data
+
+    :param push_data: List of integers. Data that is put on the stack by push commands
+    :param jumpdest_indices: List of integers. Addresses of the jumpdests
+    :param length: Number of possible biases, i.e. the length of the machine code
+    :return: Returns an array where the entry at index 'b' is the number of jumpdests 'j' for which 'j - b' is pushed
+    """
+    push_data_indicator = _get_push_data_indicator(push_data, length).astype(np.float64)
+    jumpdest_indicator = np.zeros(length)
+    jumpdest_indicator[np.asarray(jumpdest_indices, dtype=np.int64)] = 1
+
+    # cross-correlation of both indicators via FFT, zero-padded so that no bias wraps around
+    fft_length = 1 << (2 * length).bit_length()
+    correlation = np.fft.irfft(np.fft.rfft(jumpdest_indicator, fft_length) * np.conj(np.fft.rfft(push_data_indicator, fft_length)), fft_length)
+
+    return np.rint(correlation[:length]).astype(np.int64)
+
+
+def _get_push_data_indicator(push_data, length):
+    """
+    Marks all addresses of the machine code that are put on the stack by a push command
+
+    :param push_data: List of integers. Data that is put on the stack by push commands
+    :param length: Length of the machine code
+    :return: List of booleans. True if the address is pushed at least once
+    """
+    push_data = np.asarray(push_data)
+    push_data = push_data[(push_data >= 0) & (push_data < length)].astype(np.int64)  # other values can never hit an address
+
+    push_data_indicator = np.zeros(length, dtype=bool)
+    push_data_indicator[push_data] = True
+
+    return push_data_indicator
+
+
 def _get_pushjump_data(machine_code, push_data_mask, jumps_mask):
     """
     Generates a list of integer values that are placed on the stack by the push data command and followed directly by a jump command
@@ -145,21 +195,19 @@ def _get_pushjump_data(machine_code, push_data_mask, jumps_mask):
     :param machine_code: Sequence of hexadecimal numbers
     :param push_data_mask: List of booleans. Determines where push-data are located
     :param jumps_mask: List of booleans. Determines where jumps are located
-    :return: Returns a nested list [[a, b] ... ] where 'a' is the jump address and 'b' is the corresponding data that is pushed
+    :return: Returns a 2-D array [[a, b] ... ] where 'a' is the jump address and 'b' is the corresponding data that is pushed
     """
-    datasets_indices = hlp.get_compound_subsets(push_data_mask)
-    pushjump_data = []
+    set_starts, set_ends = _get_push_data_bounds(machine_code, push_data_mask)
 
-    for set in datasets_indices:
-        set_start = set[0]
-        set_end = set[-1]
+    followed_by_jump = np.asarray(jumps_mask, dtype=bool)[set_ends + 1]   # validate if push instruction is followed by a jump instruction
+    set_starts = set_starts[followed_by_jump]
+    set_ends = set_ends[followed_by_jump]
 
-        if (set_end + 1 < len(machine_code)):
-            if (jumps_mask[set_end + 1]):   # validate if push instruction is followed by a jump instruction
-                compound_data = hlp.compound_bytes_to_integer(machine_code[set_start:set_end + 1])
-                pushjump_data.append([set_end + 1, compound_data])
+    pushjump_data = np.empty((len(set_ends), 2), dtype=object)
+    pushjump_data[:, 0] = set_ends + 1
+    pushjump_data[:, 1] = _compound_push_data(machine_code, set_starts, set_ends)
 
-    return np.array(pushjump_data)
+    return pushjump_data
 
 
 def _tag_valid_segments(segments, validation_mask, invalid_indicator=False):
@@ -171,16 +219,10 @@ def _tag_valid_segments(segments, validation_mask, invalid_indicator=False):
     :param invalid_indicator: Parameter describes the detection of an invalid address
     :return: Returns a list of booleans where all valid segments are marked with true
     """
-    indices = [i for i in range(len(segments)) if validation_mask[i] == invalid_indicator]
-    invalid_segment_numbers = [segments[i] for i in indices]
-
-    valid_segments = [True] * len(segments)
-
-    for i in range(len(segments)):
-        if (segments[i] in invalid_segment_numbers):
-            valid_segments[i] = False
+    segments = np.asarray(segments)
+    invalid_segment_numbers = np.unique(segments[np.asarray(validation_mask) == invalid_indicator])
 
-    return np.array(valid_segments)
+    return np.invert(np.isin(segments, invalid_segment_numbers))
 
 
 def _get_push_data(machine_code, push_data_mask):
@@ -189,20 +231,43 @@ def _get_push_data(machine_code, push_data_mask):
 
     :param machine_code: Sequence of hexadecimal numbers
     :param push_data_mask: List of booleans. Determines where push-data are located
-    :return: Returns a list of integers where each integer corresponds to data that is put on the stack
+    :return: Returns an array of integers where each integer corresponds to data that is put on the stack
     """
-    datasets_indices = hlp.get_compound_subsets(push_data_mask)
-    push_data = []
+    set_starts, set_ends = _get_push_data_bounds(machine_code, push_data_mask)
 
-    for set in datasets_indices:
-        set_start = set[0]
-        set_end = set[-1]
+    return _compound_push_data(machine_code, set_starts, set_ends)
 
-        if (set_end + 1 < len(machine_code)):
-            compound_data = hlp.compound_bytes_to_integer(machine_code[set_start:set_end + 1])
-            push_data.append(compound_data)
 
-    return np.array(push_data)
+def _get_push_data_bounds(machine_code, push_data_mask):
+    """
+    Determines the first and last address of every push-data that is followed by another instruction
+
+    :param machine_code: Sequence of hexadecimal numbers
+    :param push_data_mask: List of booleans. Determines where push-data are located
+    :return: Returns two arrays of integers with the first and the last address of each push-data
+    """
+    push_data_mask = np.asarray(push_data_mask, dtype=bool)
+    edges = np.diff(np.concatenate([[False], push_data_mask, [False]]).astype(np.int8))  # +1 where push-data begins, -1 behind its end
+
+    set_starts = np.flatnonzero(edges == 1)
+    set_ends = np.flatnonzero(edges == -1) - 1
+
+    complete_sets = set_ends + 1 < len(machine_code)
+
+    return set_starts[complete_sets], set_ends[complete_sets]
+
+
+def _compound_push_data(machine_code, set_starts, set_ends):
+    """
+    Links the bytes of every push-data to the integer that is put on the stack
+
+    :param machine_code: Sequence of hexadecimal numbers
+    :param set_starts: Array of integers. First address of each push-data
+    :param set_ends: Array of integers. Last address of each push-data
+    :return: Returns an array of integers. Pushed values can exceed 64 bits, therefore they are kept as Python integers
+    """
+    return np.fromiter((hlp.compound_bytes_to_integer(machine_code[set_start:set_end + 1]) for set_start, set_end in zip(set_starts.tolist(), set_ends.tolist())),
+                       dtype=object, count=len(set_starts))
 
 
 def _tag_valid_jumpdests_to_starting_points(machine_code, starting_points_mask, push_data_mask, jumpdests_mask):
@@ -216,18 +281,18 @@ def _tag_valid_jumpdests_to_starting_points(machine_code, starting_points_mask,
     :return: Returns a list of booleans that match all jumpdest that can be reached from given entry points
     """
     push_data = _get_push_data(machine_code, push_data_mask)
+    push_data = _get_push_data_indicator(push_data, len(machine_code)).nonzero()[0]   # sorted and unique
     jumpdest_indices = np.argwhere(jumpdests_mask == True).flatten()
     starting_points = np.argwhere(starting_points_mask==True).flatten()
 
-    valid_jumpdest_mask = np.array([False] * len(machine_code))
+    valid_jumpdest_mask = np.zeros(len(machine_code), dtype=bool)
 
     for bias in starting_points:
-        valid_jumpdests = np.array(list(set(push_data).intersection(set(jumpdest_indices - bias)))) + bias  # find indicens
+        found_jumpdests = np.isin(jumpdest_indices - bias, push_data, assume_unique=True)  # find indices
 
-        for j in valid_jumpdests:
-            valid_jumpdest_mask[j] = True
+        valid_jumpdest_mask[jumpdest_indices[found_jumpdests]] = True
 
-        jumpdest_indices = np.array(list(set(jumpdest_indices).difference(set(valid_jumpdests))))  # remove findings
+        jumpdest_indices = jumpdest_indices[np.invert(found_jumpdests)]  # remove findings
 
     return valid_jumpdest_mask
 
@@ -1,10 +1,29 @@
+import numpy as np
+
+
+def bytes_to_array(machine_code):
+    """
+    Converts a sequence of bytes to an array of unsigned 8-bit integers
+
+    :param machine_code: Sequence of hexadecimal numbers, or a bytes-like object
+    :return: Array of unsigned 8-bit integers
+    """
+    if (isinstance(machine_code, (bytes, bytearray, memoryview))):  # NumPy would read bytes as one string instead of a sequence
+        return np.frombuffer(machine_code, dtype=np.uint8)
+
+    return np.asarray(machine_code, dtype=np.uint8)
+
+
 def bitsring_to_bytes(bitstring):
     """
     Converts a string of bits to a list of bytes
     :param bits: String of bits
     :return: List of Bytes as integers
     """
-    list_of_bytes = list(bytes(int(bitstring[i: i + 8], 2) for i in range(0, len(bitstring), 8)))
+    if (len(bitstring) == 0 or len(bitstring) % 8 != 0):  # a trailing partial byte is converted on its own
+        return list(bytes(int(bitstring[i: i + 8], 2) for i in range(0, len(bitstring), 8)))
+
+    list_of_bytes = list(int(bitstring, 2).to_bytes(len(bitstring) // 8, 'big'))
     return list_of_bytes
 
 
@@ -15,8 +34,10 @@ def hexstring_to_bytes(hexstring):
     :param hexstring: String of hex-numbers
     :return: List of Bytes as integers
     """
+    if (len(hexstring) % 2 != 0):  # a trailing single hex-number is converted on its own
+        return list(bytes(int(hexstring[i: i + 2], 16) for i in range(0, len(hexstring), 2)))
 
-    list_of_bytes = list(bytes(int(hexstring[i: i + 2], 16) for i in range(0, len(hexstring), 2)))
+    list_of_bytes = list(bytes.fromhex(hexstring))
     return list_of_bytes
 
 
@@ -26,38 +47,16 @@ def get_compound_subsets(list, indicator=True):
 
     :param list: List to be subdivided
     :param indicator: Specifies which value is to be combined into a sequence
-    :return: Returns a nested list in which each entry marks a connected segment with all addresses
+    :return: Returns a list of arrays in which each entry marks a connected segment with all addresses
     """
-    index_subset_element = []
-
-    for i in range(len(list)):
-        if (list[i] == indicator):
-            index_subset_element.append(i)
-
-    number_of_subsets = 0
-    subsets = []
+    index_subset_element = np.flatnonzero(np.asarray(list) == indicator)
 
-    for i in range(len(index_subset_element)):
+    if (index_subset_element.size == 0):
+        return []
 
-        subsets.append(number_of_subsets)
+    subset_breaks = np.flatnonzero(np.diff(index_subset_element) > 1) + 1  # a gap between two indices starts a new subset
 
-        if (i < len(index_subset_element) - 1):
-            if (index_subset_element[i + 1] - index_subset_element[i] > 1):
-                number_of_subsets = number_of_subsets + 1
-
-    subsets_indices = []  # result
-
-    for i in range(number_of_subsets + 1):
-
-        temp_splitted_element_indices = []
-
-        for j in range(len(subsets)):
-            if (subsets[j] == i):
-                temp_splitted_element_indices.append(index_subset_element[j])
-
-        subsets_indices.append(temp_splitted_element_indices)
-
-    return subsets_indices
+    return np.split(index_subset_element, subset_breaks)
 
 
 def compound_bytes_to_integer(bytes):
@@ -68,14 +67,7 @@ def compound_bytes_to_integer(bytes):
     :return: integer that is compound of given bytes
     """
 
-    n = len(bytes)
-    bit_list = []
-
-    for i in range(n):
-        bit_list.append(f'{bytes[i]:08b}')
-
-    compound_bits = ''.join(bit_list)
-    compound_int = int(compound_bits, 2)
+    compound_int = int.from_bytes(bytes_to_array(bytes).tobytes(), 'big')
 
     return compound_int
 
@@ -89,19 +81,10 @@ def segment_list(flags_segment_start, flags_segment_end):
     :return: Returns a list of integers where every integer determines a segment
     """
 
-    segments = []
-    segment_counter = 0
-
-    for i in range(len(flags_segment_start)):
-
-        if (flags_segment_start[i]):
-            segment_counter = segment_counter + 1
-            segments.append(segment_counter)
+    flags_segment_start = np.asarray(flags_segment_start, dtype=bool)
+    flags_segment_end = np.logical_and(flags_segment_end, np.invert(flags_segment_start))  # a start flag has priority over an end flag
 
-        elif (flags_segment_end[i]):
-            segments.append(segment_counter)
-            segment_counter = segment_counter + 1
-        else:
-            segments.append(segment_counter)
+    # a segment number increases at every start point and directly after every end point
+    segments = np.cumsum(flags_segment_start) + np.cumsum(flags_segment_end) - flags_segment_end
 
-    return segments
\ No newline at end of file
+    return segments
@@ -1,6 +1,21 @@
 from ethertracer import opcodes as opc
+from ethertracer import helpers as hlp
 import numpy as np
 
+VALID_LUT = np.zeros(256, dtype=bool)
+VALID_LUT[[code for code in opc.BYTECODES.keys() if 0 <= code < 256]] = True
+"""Lookup table that marks every byte value which is a valid opcode"""
+
+NAME_LUT = np.array([opc.BYTECODES[code].name if VALID_LUT[code] else opc.missing_opcode(code).name for code in range(256)])
+"""Lookup table that maps every byte value to the name of its opcode"""
+
+HEX_LUT = np.array([hex(code) for code in range(256)])
+"""Lookup table that maps every byte value to its hexadecimal representation"""
+
+PUSH_LEN_LUT = np.array([opc.BYTECODES[code].push_len() if VALID_LUT[code] else 0 for code in range(256)], dtype=np.uint8)
+"""Lookup table that maps every byte value to the number of bytes its opcode pushes"""
+
+
 def is_mnemonic(byte, mnemonic):
     return opc.BYTECODES[byte].name == mnemonic
 
@@ -12,9 +27,7 @@ def tag_valid_mnemonics(machine_code):
     :param machine_code: Sequence of hexadecimal numbers
     :return: List of boolean. True if given integer is a valid opcode, False otherwise
     """
-    tags = list(machine_code[i] in opc.BYTECODES.keys() for i in range(0, len(machine_code)))
-
-    return np.array(tags)
+    return VALID_LUT[hlp.bytes_to_array(machine_code)]
 
 
 def tag_invalid_mnemonics(machine_code):
@@ -24,9 +37,7 @@ def tag_invalid_mnemonics(machine_code):
     :param machine_code: Sequence of hexadecimal numbers
     :return: List of boolean. True if given integer is a invalid opcode, False otherwise
     """
-    tags = list(machine_code[i] not in opc.BYTECODES.keys() for i in range(0, len(machine_code)))
-
-    return np.array(tags)
+    return np.invert(VALID_LUT[hlp.bytes_to_array(machine_code)])
 
 
 def tag_mnemonic(machine_code, mnemonic):
@@ -37,9 +48,25 @@ def tag_mnemonic(machine_code, mnemonic):
     :param mnemonic: String of a mnemonic
     :return: List of booleans where every occurrence of the given mnemonic is marked as True
     """
-    tags = list(machine_code[i] == opc.OPCODES[mnemonic].code for i in range(0, len(machine_code)))
+    return tag_mnemonics(machine_code, [mnemonic])[0]
+
+
+def tag_mnemonics(machine_code, mnemonics):
+    """
+    Tags all indices of several specific opcodes at once and returns them
+
+    :param machine_code: Sequence of hexadecimal numbers
+    :param mnemonics: List of mnemonic strings
+    :return: 2-D array of booleans. Row 'k' marks every occurrence of the k-th given mnemonic as True
+    """
+    codes = [opc.OPCODES[mnemonic].code for mnemonic in mnemonics]  # look up every opcode only once
+
+    mnemonic_lut = np.zeros((len(mnemonics), 256), dtype=bool)
+    for k, code in enumerate(codes):
+        if (0 <= code < 256):
+            mnemonic_lut[k, code] = True
 
-    return np.array(tags)
+    return mnemonic_lut[:, hlp.bytes_to_array(machine_code)]
 
 
 def tag_push_data(machine_code):
@@ -50,30 +77,45 @@ def tag_push_data(machine_code):
     :return: List of boolean. True if integer belongs to a push command
     """
 
-    push1 = opc.opcode_by_name("PUSH1").code
-    push32 = opc.opcode_by_name("PUSH32").code
+    machine_code = hlp.bytes_to_array(machine_code)
+    push_lengths = PUSH_LEN_LUT[machine_code]
 
-    i = 0
-    tags = [False] * len(machine_code)  # result storage
+    push_commands = np.flatnonzero(push_lengths)
+    push_numbers = push_lengths[push_commands].astype(np.int64)
 
-    while i < len(machine_code):
-        instruction = machine_code[i]
+    # only push commands outside of push-data are instructions, so the scan has to skip over the data it finds
+    data_starts = []
+    data_ends = []
+    next_instruction = 0
 
-        if (instruction >= push1 and instruction <= push32):  # found push command
+    for i, identified_push_number in zip(push_commands.tolist(), push_numbers.tolist()):
+        if (i >= next_instruction):
+            next_instruction = i + identified_push_number + 1
+            data_starts.append(i + 1)
+            data_ends.append(next_instruction)
 
-            identified_push_number = int(opc.BYTECODES[instruction].code - push1) + 1
-            for j in range(i + 1, i + identified_push_number + 1):
-                if(j >= len(machine_code)):
-                    break
-                tags[j] = True
+    # mark the push-data ranges by a running sum over their boundaries
+    boundaries = np.zeros(len(machine_code) + 1, dtype=np.int64)
+    boundaries[np.minimum(data_starts, len(machine_code)).astype(np.int64)] += 1
+    boundaries[np.minimum(data_ends, len(machine_code)).astype(np.int64)] -= 1
 
-            i = i + identified_push_number
+    return np.cumsum(boundaries[:-1]) > 0
 
-        i = i + 1
-
-    return np.array(tags)
 
+def tag_all(machine_code):
+    """
+    Tags push-data, invalid opcodes and all mnemonics that are relevant for the segmentation at once
 
+    :param machine_code: Sequence of hexadecimal numbers
+    :return: Tuple of lists of booleans: push-data, invalid mnemonics, JUMPDEST, JUMP, STOP, RETURN and SELFDESTRUCT. Findings within push-data are ignored
+    """
+    machine_code = hlp.bytes_to_array(machine_code)   # convert only once for all taggers
 
+    push_data_mask = tag_push_data(machine_code)
+    findings = np.vstack([tag_invalid_mnemonics(machine_code),
+                          tag_mnemonics(machine_code, ["JUMPDEST", "JUMP", "STOP", "RETURN", "SELFDESTRUCT"])])
 
+    not_push_data_mask = np.invert(push_data_mask)
+    findings &= not_push_data_mask  # ignore findings within push-data, all rows in one pass
 
+    return (push_data_mask, *findings)